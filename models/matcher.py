@@ -1,7 +1,11 @@
 from typing import List, Dict, Set, Tuple
 from supabase import Client
+import heapq
 import re
+import sys
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 warnings.filterwarnings('ignore')
 
 class OutletMatcher:
@@ -10,6 +14,7 @@ class OutletMatcher:
     # Core configuration
     MIN_RESULTS = 8
     AI_PARTNER_NULL_STATE = "Unconfirmed"
+    NLP_LOAD_TIMEOUT = 30  # seconds a match waits for the background spaCy load
     
     # Outlet families mapping
     OUTLET_FAMILIES = {
@@ -29,6 +34,14 @@ class OutletMatcher:
         'GeneralTech/Consumer': ['TechCrunch', 'Wired', 'The Verge', 'Ars Technica', 'Engadget', 'Gizmodo', 'Mashable', 'VentureBeat', 'The Next Web', 'Recode']
     }
     
+    # Per-family matchers compiled once: regex for "family outlet in name", joined names for "name in family outlet"
+    FAMILY_MATCHERS = [
+        (family,
+         re.compile('|'.join(re.escape(family_outlet.lower()) for family_outlet in family_outlets)),
+         '\x00'.join(family_outlet.lower() for family_outlet in family_outlets))
+        for family, family_outlets in OUTLET_FAMILIES.items()
+    ]
+    
     # Trigger dictionary (abstract keywords → families)
     TRIGGER_DICTIONARY = {
         'Cybersecurity': ['cybersecurity', 'security', 'ciso', 'ransomware', 'phishing', 'zero trust', 'soc', 'siem', 'threat', 'incident'],
@@ -44,6 +57,40 @@ class OutletMatcher:
         'RealEstate/BuiltEnv': ['real estate', 'property', 'proptech', 'building', 'construction', 'infrastructure', 'cre'],
         'Lifestyle/Wellness': ['wellness', 'mental health', 'mindfulness', 'work-life', 'sleep', 'nutrition']
     }
+    
+    # Lowercased, immutable trigger sets built once at class load
+    TRIGGER_TERMS = {
+        family: frozenset(trigger.lower() for trigger in triggers)
+        for family, triggers in TRIGGER_DICTIONARY.items()
+    }
+    
+    # One bit per family; an outlet's family set is stored as the OR of its bits
+    FAMILY_BITS = {family: 1 << bit for bit, family in enumerate(OUTLET_FAMILIES)}
+    
+    # Every distinct trigger, scanned once per abstract; hits are mapped back to families by set intersection
+    TRIGGER_VOCABULARY = frozenset().union(*TRIGGER_TERMS.values())
+    
+    # Business Executives tier-one outlets
+    TIER_ONE_OUTLETS = frozenset(OUTLET_FAMILIES['Business/TierOne'])
+    
+    # Flag bit above the family bits, set on outlets named exactly as a tier-one outlet
+    TIER_ONE_BIT = 1 << len(OUTLET_FAMILIES)
+    
+    # Process-wide state: Pitch builds a matcher per request, so config and spaCy are loaded once
+    _shared_lock = threading.Lock()
+    _shared_matching_config = None
+    _shared_nlp = None
+    _shared_nlp_started = False
+    _shared_nlp_ready = threading.Event()
+    
+    # Comma-separated field value (Column G / F) → parsed lowercase terms
+    _parsed_terms: Dict[str, Tuple[str, ...]] = {}
+    
+    # Parsed term → spaCy lemma of its first token, filled in batches by _cache_term_lemmas
+    _term_lemmas: Dict[str, str] = {}
+    
+    # Outlet name → family/flag bitmask; names depend only on the class tables, so every instance shares one map
+    _family_masks_by_name: Dict[str, int] = {}
 
     def __init__(self, supabase_client: Client):
         """Initialize the outlet matcher with v4 configuration."""
@@ -53,11 +100,18 @@ class OutletMatcher:
         # Load matching configuration
         self.matching_config = self._load_matching_config()
         
-        # Initialize NLP for keyword matching
-        self.nlp = self._initialize_nlp()
+        # Initialize NLP for keyword matching (loads in the background; see the nlp property)
+        self._initialize_nlp()
 
     def _load_matching_config(self) -> Dict:
-        """Load the matching configuration from JSON file."""
+        """Load the matching configuration once per process."""
+        with OutletMatcher._shared_lock:
+            if OutletMatcher._shared_matching_config is None:
+                OutletMatcher._shared_matching_config = self._read_matching_config()
+            return OutletMatcher._shared_matching_config
+
+    def _read_matching_config(self) -> Dict:
+        """Read the matching configuration from JSON file."""
         try:
             import os
             import json
@@ -70,11 +124,35 @@ class OutletMatcher:
             print(f"⚠️ Failed to load matching config: {e}")
             return {}
 
-    def _initialize_nlp(self):
-        """Initialize NLP for keyword matching with graceful fallback."""
+    def _initialize_nlp(self) -> None:
+        """Start loading spaCy once per process on a daemon thread so construction never blocks."""
+        with OutletMatcher._shared_lock:
+            if OutletMatcher._shared_nlp_started:
+                return
+            OutletMatcher._shared_nlp_started = True
+        threading.Thread(target=self._load_shared_nlp, name="outlet-matcher-nlp", daemon=True).start()
+
+    def _load_shared_nlp(self) -> None:
+        """Background target: load the pipeline and signal waiting matches."""
+        try:
+            OutletMatcher._shared_nlp = self._load_nlp()
+        finally:
+            OutletMatcher._shared_nlp_ready.set()
+
+    @property
+    def nlp(self):
+        """spaCy pipeline, or None when unavailable; waits for the background load on first use."""
+        if not OutletMatcher._shared_nlp_ready.wait(self.NLP_LOAD_TIMEOUT):
+            print(f"⚠️ spaCy still loading after {self.NLP_LOAD_TIMEOUT}s - using fallback keyword matching")
+            return None
+        return OutletMatcher._shared_nlp
+
+    def _load_nlp(self):
+        """Load the spaCy pipeline with graceful fallback."""
         try:
             import spacy  # type: ignore
-            nlp = spacy.load("en_core_web_sm")
+            # Matching reads only token text and lemmas; the dependency parser and NER never contribute
+            nlp = spacy.load("en_core_web_sm", exclude=["parser", "ner"])
             print("✅ spaCy loaded for keyword matching")
             return nlp
         except ImportError:
@@ -84,269 +162,356 @@ class OutletMatcher:
             print(f"⚠️ spaCy model not found: {e} - using fallback keyword matching")
             return None
 
-    def _hard_audience_filter(self, outlets: List[Dict], selected_audience: str) -> List[Dict]:
-        """Hard audience pre-filter using Column M with exact token matching."""
-        filtered_outlets = []
-        selected_audience_lower = selected_audience.lower()
-        
-        for outlet in outlets:
-            outlet_audience_tags = outlet.get('Industry', '')  # Column M
-            
+    def _index_outlets(self, outlets: List[Dict]) -> None:
+        """Store outlet fields as parallel row-indexed columns, parsed once per load."""
+        self._outlets = outlets
+        self._outlet_names = [outlet.get('Outlet Name', '') for outlet in outlets]
+        self._outlet_keyword_terms = [self._parse_terms(outlet.get('Keywords', '')) for outlet in outlets]  # Column G
+        # Column F, lowercased once per load and interned so repeated values share one string;
+        # a non-str value is treated as empty so one malformed row cannot break every match
+        self._outlet_audiences_lower = [
+            sys.intern(audience.lower()) if isinstance(audience, str) and audience else ''
+            for audience in (outlet.get('Audience', '') for outlet in outlets)
+        ]
+        self._outlet_audience_terms = [self._parse_terms(audience) for audience in self._outlet_audiences_lower]
+        self._outlet_industries = [outlet.get('Industry', '') for outlet in outlets]  # Column M
+        
+        # Every fetched row is classified here, so a malformed (non-str) name must not break other audiences' matches
+        family_masks_by_name = self._precompute_outlet_families(self._outlet_names)
+        self._outlet_family_masks = tuple(
+            family_masks_by_name[name] if isinstance(name, str) else 0 for name in self._outlet_names
+        )
+        
+        # Inverted Column M index: lowercase audience token → rows carrying it
+        self._rows_by_audience: Dict[str, List[int]] = {}
+        for row, outlet_audience_tags in enumerate(self._outlet_industries):
             if not outlet_audience_tags:
                 continue
-            
-            # Split Column M by ;, trim, lowercase
-            audience_tokens = [tag.strip().lower() for tag in outlet_audience_tags.split(';')]
-            
-            # Keep outlets where selected audience matches a full token (exact, case-insensitive)
-            if selected_audience_lower in audience_tokens:
-                filtered_outlets.append(outlet)
+            for token in {tag.strip().lower() for tag in outlet_audience_tags.split(';')}:
+                self._rows_by_audience.setdefault(token, []).append(row)
+
+    def _hard_audience_filter(self, selected_audience: str) -> List[int]:
+        """Hard audience pre-filter using Column M with exact token matching."""
+        # Keep outlets where selected audience matches a full token (exact, case-insensitive)
+        filtered_rows = self._rows_by_audience.get(selected_audience.lower(), [])
         
-        print(f"🔍 Hard filter: {len(outlets)} → {len(filtered_outlets)} outlets for '{selected_audience}'")
-        return filtered_outlets
+        print(f"🔍 Hard filter: {len(self._outlets)} → {len(filtered_rows)} outlets for '{selected_audience}'")
+        return filtered_rows
 
-    def _get_outlet_families(self, outlet_name: str) -> List[str]:
+    def _get_outlet_families(self, outlet_name: str) -> Tuple[str, ...]:
         """Assign outlet to families based on outlet name."""
         outlet_name_lower = outlet_name.lower()
-        families = []
-        
-        for family, outlets in self.OUTLET_FAMILIES.items():
-            for family_outlet in outlets:
-                if family_outlet.lower() in outlet_name_lower or outlet_name_lower in family_outlet.lower():
-                    families.append(family)
-                    break
+        return tuple(
+            family for family, family_pattern, family_names in self.FAMILY_MATCHERS
+            if family_pattern.search(outlet_name_lower) or outlet_name_lower in family_names
+        )
+
+    def _parse_terms(self, field: str) -> Tuple[str, ...]:
+        """Split a comma-separated field into stripped lowercase terms, once per distinct value.
+        
+        Runs for every fetched row, so empty or non-str values (malformed Column G / F) parse to no terms.
+        """
+        if not field or not isinstance(field, str):
+            return ()
+        
+        terms = self._parsed_terms.get(field)
+        if terms is None:
+            terms = tuple(term.strip().lower() for term in field.split(','))
+            self._parsed_terms[field] = terms
+        return terms
+
+    def _fallback_keyword_match(self, abstract_lower: str, keyword_terms: Tuple[str, ...]) -> int:
+        """Simple substring keyword match used when spaCy is unavailable."""
+        return 1 if any(map(abstract_lower.__contains__, keyword_terms)) else 0
+
+    def _fallback_audience_match(self, abstract_lower: str, outlet_audience_lower: str) -> int:
+        """Simple substring audience match used when spaCy is unavailable."""
+        return 1 if outlet_audience_lower in abstract_lower else 0
+
+    def _count_term_matches(self, abstract_tokens, terms: Tuple[str, ...], term_matches: Dict[str, bool]) -> int:
+        """Count terms matching a token of the parsed abstract (exact, lemma or substring).
+        
+        term_matches caches the per-term outcome for the current match, since outlets share many terms.
+        """
+        matches = 0
+        for term in terms:
+            if not term:
+                continue
+            
+            matched = term_matches.get(term)
+            if matched is None:
+                matched = term_matches[term] = self._term_matches_abstract(abstract_tokens, term)
+            if matched:
+                matches += 1
         
-        return families
+        return matches
 
-    def _count_trigger_hits(self, abstract: str, family: str) -> int:
-        """Count trigger hits for a specific family in the abstract."""
-        if family not in self.TRIGGER_DICTIONARY:
-            return 0
+    def _term_matches_abstract(self, abstract_tokens, term: str) -> bool:
+        """Whether any abstract token equals the term, shares its lemma, or contains / is contained in it."""
+        token_texts, token_text_set, token_lemmas = abstract_tokens
+        
+        # Check for exact matches and lemmatized matches
+        if term in token_text_set:
+            return True
+        
+        term_lemma = self._term_lemmas.get(term)
+        if term_lemma is None:
+            term_doc = self.nlp(term)
+            term_lemma = self._term_lemmas[term] = term_doc[0].lemma_ if len(term_doc) > 0 else term
+        if term_lemma in token_lemmas:
+            return True
+        
+        return any(term in token_text or token_text in term for token_text in token_texts)
+
+    def _parse_abstract(self, abstract_lower: str):
+        """Parse the lowercased abstract with spaCy once per match; None means use the substring fallback."""
+        if not abstract_lower:
+            return None
         
-        abstract_lower = abstract.lower()
-        triggers = self.TRIGGER_DICTIONARY[family]
-        hits = 0
+        # Read the property once: while spaCy is still loading each access waits and prints a warning
+        nlp = self.nlp
+        if not nlp:
+            return None
         
-        for trigger in triggers:
-            if trigger.lower() in abstract_lower:
-                hits += 1
+        try:
+            return nlp(abstract_lower)
+        except ValueError as e:
+            # spaCy rejects texts longer than nlp.max_length
+            print(f"⚠️ spaCy parsing failed: {e}, using fallback")
+            return None
+
+    def _cache_term_lemmas(self, rows: List[int]) -> None:
+        """Lemmatize Column G / F terms of the given rows not seen by earlier matches, in one nlp.pipe batch."""
+        term_lemmas = self._term_lemmas
+        new_terms = list({
+            term
+            for row in rows
+            for terms in (self._outlet_keyword_terms[row], self._outlet_audience_terms[row])
+            for term in terms
+            if term and term not in term_lemmas
+        })
+        if not new_terms:
+            return
+        
+        for term, term_doc in zip(new_terms, self.nlp.pipe(new_terms, batch_size=256)):
+            term_lemmas[term] = term_doc[0].lemma_ if len(term_doc) > 0 else term
+
+    def _index_abstract_tokens(self, abstract_doc):
+        """Pack the parsed abstract's token texts and lemmas once per match; None when there is no parse."""
+        if abstract_doc is None:
+            return None
         
-        return hits
+        token_texts = tuple(token.text for token in abstract_doc)
+        return token_texts, frozenset(token_texts), frozenset(token.lemma_ for token in abstract_doc)
 
-    def _count_keyword_matches(self, abstract: str, outlet_keywords: str) -> int:
+    def _count_keyword_matches(self, abstract_lower: str, abstract_tokens, keyword_terms: Tuple[str, ...],
+                               term_matches: Dict[str, bool]) -> int:
         """Count keyword matches between abstract and outlet keywords (Column G) using spaCy."""
-        if not outlet_keywords or not abstract:
+        if not keyword_terms or not abstract_lower:
             return 0
         
         # Fallback to simple string matching if spaCy not available
-        if not self.nlp:
-            abstract_lower = abstract.lower()
-            outlet_keywords_lower = outlet_keywords.lower()
-            return 1 if any(keyword.strip().lower() in abstract_lower for keyword in outlet_keywords.split(',')) else 0
+        if abstract_tokens is None:
+            return self._fallback_keyword_match(abstract_lower, keyword_terms)
         
-        try:
-            # Use spaCy for better keyword matching
-            abstract_doc = self.nlp(abstract.lower())
-            outlet_keywords_list = [kw.strip().lower() for kw in outlet_keywords.split(',')]
-            
-            matches = 0
-            for keyword in outlet_keywords_list:
-                if not keyword:
-                    continue
-                
-                # Check for exact matches and lemmatized matches
-                keyword_doc = self.nlp(keyword)
-                keyword_lemma = keyword_doc[0].lemma_ if len(keyword_doc) > 0 else keyword
-                
-                for token in abstract_doc:
-                    if (token.text == keyword or 
-                        token.lemma_ == keyword_lemma or 
-                        keyword in token.text or 
-                        token.text in keyword):
-                        matches += 1
-                        break
-            
-            return matches
-        except Exception as e:
-            print(f"⚠️ spaCy keyword matching failed: {e}, using fallback")
-            # Fallback to simple matching
-            abstract_lower = abstract.lower()
-            outlet_keywords_lower = outlet_keywords.lower()
-            return 1 if any(keyword.strip().lower() in abstract_lower for keyword in outlet_keywords.split(',')) else 0
+        return self._count_term_matches(abstract_tokens, keyword_terms, term_matches)
 
-    def _count_audience_matches(self, abstract: str, outlet_audience: str) -> int:
-        """Count audience matches between abstract and outlet audience (Column F) using spaCy."""
-        if not outlet_audience or not abstract:
+    def _count_audience_matches(self, abstract_lower: str, abstract_tokens, outlet_audience_lower: str,
+                                audience_terms: Tuple[str, ...], term_matches: Dict[str, bool]) -> int:
+        """Count audience matches between abstract and lowercased outlet audience (Column F) using spaCy."""
+        if not outlet_audience_lower or not abstract_lower:
             return 0
         
         # Fallback to simple string matching if spaCy not available
-        if not self.nlp:
-            abstract_lower = abstract.lower()
-            outlet_audience_lower = outlet_audience.lower()
-            return 1 if outlet_audience_lower in abstract_lower else 0
+        if abstract_tokens is None:
+            return self._fallback_audience_match(abstract_lower, outlet_audience_lower)
         
-        try:
-            # Use spaCy for better audience matching
-            abstract_doc = self.nlp(abstract.lower())
-            outlet_audience_lower = outlet_audience.lower()
-            
-            # Check for audience terms in abstract
-            audience_terms = [term.strip().lower() for term in outlet_audience_lower.split(',')]
-            
-            matches = 0
-            for audience_term in audience_terms:
-                if not audience_term:
-                    continue
-                
-                audience_doc = self.nlp(audience_term)
-                audience_lemma = audience_doc[0].lemma_ if len(audience_doc) > 0 else audience_term
-                
-                for token in abstract_doc:
-                    if (token.text == audience_term or 
-                        token.lemma_ == audience_lemma or 
-                        audience_term in token.text or 
-                        token.text in audience_term):
-                        matches += 1
-                        break
-            
-            return matches
-        except Exception as e:
-            print(f"⚠️ spaCy audience matching failed: {e}, using fallback")
-            # Fallback to simple matching
-            abstract_lower = abstract.lower()
-            outlet_audience_lower = outlet_audience.lower()
-            return 1 if outlet_audience_lower in abstract_lower else 0
+        # Check for audience terms in abstract
+        return self._count_term_matches(abstract_tokens, audience_terms, term_matches)
+
+    def _count_all_trigger_hits(self, abstract_lower: str) -> Dict[str, int]:
+        """Count trigger hits for every family in one pass over the trigger vocabulary."""
+        found_triggers = frozenset(filter(abstract_lower.__contains__, self.TRIGGER_VOCABULARY))
+        return {family: len(triggers & found_triggers) for family, triggers in self.TRIGGER_TERMS.items()}
 
-    def _compute_score(self, outlet: Dict, abstract: str, selected_audience: str) -> float:
-        """Compute score using exact ranking logic with spaCy keyword matching."""
-        outlet_name = outlet.get('Outlet Name', '')
-        outlet_keywords = outlet.get('Keywords', '')  # Column G
-        outlet_audience = outlet.get('Audience', '')  # Column F
-        outlet_families = self._get_outlet_families(outlet_name)
+    def _family_mask(self, outlet_families: Tuple[str, ...]) -> int:
+        """Pack a family tuple into a FAMILY_BITS bitmask."""
+        family_mask = 0
+        for family in outlet_families:
+            family_mask |= self.FAMILY_BITS[family]
+        return family_mask
+
+    def _precompute_outlet_families(self, outlet_names: List[str]) -> Dict[str, int]:
+        """Assign family/flag bitmasks once per distinct outlet name; names seen by any earlier load are reused.
+        
+        Non-str names (e.g. a null Outlet Name) are skipped; they belong to no family.
+        """
+        family_masks_by_name = self._family_masks_by_name
+        for outlet_name in outlet_names:
+            if isinstance(outlet_name, str) and outlet_name not in family_masks_by_name:
+                family_mask = self._family_mask(self._get_outlet_families(outlet_name))
+                if outlet_name in self.TIER_ONE_OUTLETS:
+                    family_mask |= self.TIER_ONE_BIT
+                family_masks_by_name[outlet_name] = family_mask
+        return family_masks_by_name
+
+    def _score_families(self, family_mask: int, selected_audience: str, trigger_hits: Dict[str, int]) -> int:
+        """Points, in tenths, that depend only on the family/flag bitmask, selected audience and abstract."""
+        selected_bit = self.FAMILY_BITS.get(selected_audience, 0)
+        score = 0
         
-        score = 0.0
+        # +2.0 per primary-family trigger hit from the abstract (cap +6.0)
+        primary_triggers = trigger_hits.get(selected_audience, 0)
+        score += min(primary_triggers * 20, 60)
         
         # +3.0 if outlet has a family that matches the selected audience
-        if selected_audience in outlet_families:
-            score += 3.0
-        
-        # +2.0 per primary-family trigger hit from the abstract (cap +6.0)
-        primary_triggers = self._count_trigger_hits(abstract, selected_audience)
-        score += min(primary_triggers * 2.0, 6.0)
+        if family_mask & selected_bit:
+            score += 30
         
         # +1.0 per secondary-family trigger (families present on outlet but not selected audience, cap +2.0)
-        secondary_score = 0.0
-        for family in outlet_families:
-            if family != selected_audience:
-                family_triggers = self._count_trigger_hits(abstract, family)
-                secondary_score += family_triggers * 1.0
-        score += min(secondary_score, 2.0)
-        
-        # +1.0 per keyword match between abstract and outlet keywords (Column G) using spaCy
-        keyword_matches = self._count_keyword_matches(abstract, outlet_keywords)
-        score += min(keyword_matches * 1.0, 3.0)  # Cap at +3.0
-        
-        # +0.5 per audience match between abstract and outlet audience (Column F) using spaCy
-        audience_matches = self._count_audience_matches(abstract, outlet_audience)
-        score += min(audience_matches * 0.5, 1.5)  # Cap at +1.5
-        
         # -3.0 cross-family penalty: if outlet is in non-selected family and abstract has no triggers for that family
-        for family in outlet_families:
-            if family != selected_audience:
-                family_triggers = self._count_trigger_hits(abstract, family)
+        secondary_score = 0
+        for family, family_bit in self.FAMILY_BITS.items():
+            if family_mask & family_bit and family_bit != selected_bit:
+                family_triggers = trigger_hits.get(family, 0)
+                secondary_score += family_triggers * 10
                 if family_triggers == 0:
-                    score -= 3.0
+                    score -= 30
+        score += min(secondary_score, 20)
         
         # Business Executives only: +1.8 if outlet is in tier-one list
-        if selected_audience == "Business Executives":
-            tier_one_outlets = ['The Wall Street Journal', 'Financial Times', 'Bloomberg', 'The Economist', 'Fortune', 'Harvard Business Review', 'Business Insider', 'TIME', 'The Atlantic', 'Fast Company', 'Inc.']
-            if outlet_name in tier_one_outlets:
-                score += 1.8
+        if selected_audience == "Business Executives" and family_mask & self.TIER_ONE_BIT:
+            score += 18
         
         return score
 
-    def _normalize_scores(self, scored_results: List[Dict]) -> List[Dict]:
+    def _compute_score(self, row: int, abstract_lower: str, abstract_tokens, selected_audience: str,
+                       trigger_hits: Dict[str, int], family_points: Dict[int, int],
+                       text_points: Dict[Tuple[Tuple[str, ...], str], int], term_matches: Dict[str, bool]) -> float:
+        """Compute score using exact ranking logic with spaCy keyword matching.
+        
+        family_points caches _score_families per distinct family/flag bitmask for the current match;
+        text_points caches keyword + audience points per distinct (Column G terms, Column F) pair,
+        since many outlets share identical fields; term_matches caches each term's spaCy match outcome.
+        """
+        keyword_terms = self._outlet_keyword_terms[row]  # Column G
+        outlet_audience_lower = self._outlet_audiences_lower[row]  # Column F
+        audience_terms = self._outlet_audience_terms[row]
+        family_mask = self._outlet_family_masks[row]
+        
+        # Points are accumulated in integer tenths so totals are exact (no float drift between equal scores)
+        score = family_points.get(family_mask)
+        if score is None:
+            score = family_points[family_mask] = self._score_families(family_mask, selected_audience, trigger_hits)
+        
+        text_key = (keyword_terms, outlet_audience_lower)
+        outlet_text_points = text_points.get(text_key)
+        if outlet_text_points is None:
+            # +1.0 per keyword match between abstract and outlet keywords (Column G) using spaCy
+            keyword_matches = self._count_keyword_matches(abstract_lower, abstract_tokens, keyword_terms, term_matches)
+            outlet_text_points = min(keyword_matches * 10, 30)  # Cap at +3.0
+            
+            # +0.5 per audience match between abstract and outlet audience (Column F) using spaCy
+            audience_matches = self._count_audience_matches(abstract_lower, abstract_tokens, outlet_audience_lower, audience_terms,
+                                                           term_matches)
+            outlet_text_points += min(audience_matches * 5, 15)  # Cap at +1.5
+            
+            text_points[text_key] = outlet_text_points
+        score += outlet_text_points
+        
+        return score / 10
+
+    def _normalize_scores(self, scores: List[float]) -> List[float]:
         """Normalize scores within the candidate set to 50-100, cap at 100."""
-        if not scored_results:
-            return scored_results
+        if not scores:
+            return scores
         
-        scores = [result['score'] for result in scored_results]
         min_score = min(scores)
         max_score = max(scores)
         
         # Avoid division by zero
         if max_score == min_score:
-            normalized_results = [{'outlet': result['outlet'], 'score': 75.0} for result in scored_results]
-        else:
-            normalized_results = []
-            for result in scored_results:
-                # Normalize to 50-100 range instead of 0-100
-                normalized_score = 50 + ((result['score'] - min_score) / (max_score - min_score)) * 50
-                normalized_score = min(normalized_score, 100.0)  # Cap at 100
-                normalized_results.append({
-                    'outlet': result['outlet'],
-                    'score': normalized_score
-                })
-        
-        return normalized_results
+            return [75.0] * len(scores)
+        
+        # Normalize to 50-100 range instead of 0-100; the scale factor is computed once
+        scale = 50 / (max_score - min_score)
+        return [min(50 + (score - min_score) * scale, 100.0) for score in scores]  # Cap at 100
 
     def find_matches_v4(self, abstract: str, industry: str, limit: int = 20, debug_mode: bool = False) -> List[Dict]:
         """V4 matching logic with exact specification implementation."""
         print(f"🎯 Starting v4 matching for '{industry}' audience")
         
-        # Get all outlets
-        all_outlets = self.get_outlets()
+        # Fetch and index outlets on a worker thread (network-bound) while the abstract is analysed here;
+        # the lowercased abstract, trigger hits and the spaCy parse are computed once per match, not per outlet
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            outlets_loaded = executor.submit(self._load_outlets)
+            abstract_lower = abstract.lower()
+            trigger_hits = self._count_all_trigger_hits(abstract_lower)
+            abstract_tokens = self._index_abstract_tokens(self._parse_abstract(abstract_lower))
+            all_outlets = outlets_loaded.result()
+        
         if not all_outlets:
             print("❌ No outlets found")
             return []
         
         # Step 1: Hard audience pre-filter (Column M)
-        filtered_outlets = self._hard_audience_filter(all_outlets, industry)
+        filtered_rows = self._hard_audience_filter(industry)
         
         # If zero remain, show empty state (do not fall back to keyword-only)
-        if not filtered_outlets:
+        if not filtered_rows:
             print(f"❌ No outlets found for audience '{industry}' - showing empty state")
             return []
         
-        # Step 2: Score all candidates
-        scored_results = []
-        for outlet in filtered_outlets:
-            score = self._compute_score(outlet, abstract, industry)
-            scored_results.append({
-                'outlet': outlet,
-                'score': score
-            })
+        # Lemmatize new outlet terms in one batch instead of one spaCy call per term
+        if abstract_tokens is not None:
+            self._cache_term_lemmas(filtered_rows)
         
-        # Step 3: Normalize scores to 0-100
-        normalized_results = self._normalize_scores(scored_results)
+        # Step 2: Score all candidates; scores are kept in a list parallel to filtered_rows
+        family_points = {}
+        text_points = {}
+        term_matches = {}
+        scores = [
+            self._compute_score(row, abstract_lower, abstract_tokens, industry, trigger_hits,
+                                family_points, text_points, term_matches)
+            for row in filtered_rows
+        ]
         
-        # Step 4: Sort by score desc; tie → outlet name asc (deterministic)
-        normalized_results.sort(key=lambda x: (-x['score'], x['outlet'].get('Outlet Name', '')))
+        # Step 3: Normalize scores to 0-100
+        normalized_scores = self._normalize_scores(scores)
         
-        # Step 5: Limit results
-        final_results = normalized_results[:limit]
+        # Step 4 + 5: Top `limit` by score desc; tie → outlet name asc (deterministic).
+        # A bounded heap avoids sorting every candidate when only the first page is returned.
+        outlet_names = self._outlet_names
+        top_candidates = heapq.nsmallest(
+            limit, range(len(filtered_rows)),
+            key=lambda i: (-normalized_scores[i], outlet_names[filtered_rows[i]])
+        )
+        final_results = [(self._outlets[filtered_rows[i]], normalized_scores[i]) for i in top_candidates]
         
         print(f"✅ Returning {len(final_results)} results for '{industry}' audience")
         
         # Format results to match expected structure
-        formatted_results = []
-        for result in final_results:
-            outlet = result['outlet']
-            score = result['score']
-            
-            formatted_results.append({
+        return [
+            {
                 'outlet': outlet,
                 'score': score / 100.0,  # Convert to 0-1 range for internal use
                 'match_confidence': f'{score:.1f}%',  # Display as percentage with 1 decimal
                 'match_explanation': f"Audience: {industry} | Score: {score:.1f}/100 | Outlet: {outlet.get('Outlet Name', 'Unknown')}"
-            })
-        
-        return formatted_results
+            }
+            for outlet, score in final_results
+        ]
 
     def find_matches(self, abstract: str, industry: str, limit: int = 20, debug_mode: bool = False) -> List[Dict]:
         """Main matching method - now uses v4 logic."""
         return self.find_matches_v4(abstract, industry, limit, debug_mode)
 
+    def _load_outlets(self) -> List[Dict]:
+        """Fetch all outlets and index them for matching."""
+        outlets = self.get_outlets()
+        if outlets:
+            self._index_outlets(outlets)
+        return outlets
+
     def get_outlets(self) -> List[Dict]:
         """Get all outlets from Supabase."""
         try:
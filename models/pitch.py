@@ -9,16 +9,30 @@ from services.supabase_service import supabase
 load_dotenv()
 
 class Pitch:
+    # Tech/industry terms reported by _extract_topics, in priority order
+    TOPIC_TERMS = ('ai', 'artificial intelligence', 'machine learning', 'cybersecurity', 'blockchain', 'cloud', 'data', 'software', 'tech', 'technology')
+
+    # Common words ignored by _extract_key_terms
+    STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'})
+
     def __init__(self, abstract: str, industry: str, user_id: str = None, plan_type: str = None):
         self.abstract = abstract
         self.industry = industry
         self.user_id = user_id
         self.plan_type = plan_type
         self.matcher = OutletMatcher(supabase)
+        # debug_mode → matches; the submit route and insert_pitch both ask for this pitch's matches
+        self._matches: Dict[bool, List[Dict]] = {}
 
     def find_matching_outlets(self, debug_mode: bool = False) -> List[Dict]:
-        """Find matching outlets for the pitch using semantic analysis with optional debug mode."""
-        return self.matcher.find_matches(self.abstract, self.industry, debug_mode=debug_mode)
+        """Find matching outlets for the pitch using semantic analysis with optional debug mode.
+        
+        Results are computed once per pitch and reused by later calls.
+        """
+        matches = self._matches.get(debug_mode)
+        if matches is None:
+            matches = self._matches[debug_mode] = self.matcher.find_matches(self.abstract, self.industry, debug_mode=debug_mode)
+        return matches
 
     def analyze_user_input(self) -> Dict:
         """Analyze user input to extract topics and themes."""
@@ -34,13 +48,8 @@ class Pitch:
     def _extract_topics(self) -> List[str]:
         """Extract main topics from abstract."""
         # Simple topic extraction based on common tech/industry terms
-        tech_terms = ['ai', 'artificial intelligence', 'machine learning', 'cybersecurity', 'blockchain', 'cloud', 'data', 'software', 'tech', 'technology']
-        topics = []
         abstract_lower = self.abstract.lower()
-        
-        for term in tech_terms:
-            if term in abstract_lower:
-                topics.append(term)
+        topics = [term for term in self.TOPIC_TERMS if term in abstract_lower]
         
         return topics[:3]  # Return top 3 topics
 
@@ -49,9 +58,19 @@ class Pitch:
         # Simple key term extraction
         words = self.abstract.lower().split()
         # Filter out common words and get unique terms
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'}
-        key_terms = [word for word in words if word not in stop_words and len(word) > 3]
-        return list(set(key_terms))[:10]  # Return top 10 unique terms
+        key_terms = {word for word in words if len(word) > 3 and word not in self.STOP_WORDS}
+        return list(key_terms)[:10]  # Return top 10 unique terms
+
+    @staticmethod
+    def _serialize_match(match: Dict) -> Dict:
+        """Shape a matcher result for storage in the pitches table."""
+        explanation = match["match_explanation"]
+        return {
+            "outlet": match["outlet"],
+            "score": float(match["score"]),
+            "match_confidence": match["match_confidence"],
+            "match_explanation": list(explanation) if isinstance(explanation, (list, tuple)) else []
+        }
 
     def insert_pitch(self):
         try:
@@ -71,28 +90,8 @@ class Pitch:
 
             # Add matched outlets data based on plan type
             if self.plan_type and self.plan_type.lower() != "basic":
-                # Ensure all data is JSON serializable
-                serializable_matches = []
-                for match in matched_outlets:
-                    try:
-                        serializable_match = {
-                            "outlet": match["outlet"],
-                            "score": float(match["score"]) if isinstance(match["score"], (int, float)) else 0.0,
-                            "match_confidence": str(match["match_confidence"]),
-                            "match_explanation": list(match["match_explanation"]) if isinstance(match["match_explanation"], (list, tuple)) else []
-                        }
-                        serializable_matches.append(serializable_match)
-                    except Exception as match_error:
-                        print(f"Error serializing match: {match_error}")
-                        # Add a fallback match with basic data
-                        serializable_matches.append({
-                            "outlet": match.get("outlet", {}),
-                            "score": 0.0,
-                            "match_confidence": "0%",
-                            "match_explanation": ["Error processing match"]
-                        })
-                
-                pitch_data["matched_outlets"] = serializable_matches
+                # Matcher output is already JSON-native (float score, str confidence)
+                pitch_data["matched_outlets"] = [self._serialize_match(match) for match in matched_outlets]
             else:
                 # For basic plan, only store basic outlet information
                 basic_outlets = []